@@ -2,6 +2,7 @@
 FastAPI server for the semiconductor learning system
 """
 
+import importlib.util
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -22,6 +23,15 @@ except ImportError:
     BaseModel = None
     uvicorn = None
 
+# ORJSONResponse imports without orjson and only fails at render time, so check for it first
+if importlib.util.find_spec("orjson") is not None:
+    try:
+        from fastapi.responses import ORJSONResponse
+    except ImportError:
+        ORJSONResponse = None
+else:
+    ORJSONResponse = None
+
 from core.config import config
 from core.database import db_manager
 from core.system_monitor import system_monitor
@@ -60,12 +70,16 @@ def create_app() -> FastAPI:
     if FastAPI is None:
         raise ImportError("FastAPI not available")
     
+    # Prefer orjson for serializing large payloads (sources, timelines)
+    response_class = ORJSONResponse or JSONResponse
+    
     app = FastAPI(
         title="Semiconductor Manufacturing Learning System",
         description="AI-powered system for learning about semiconductor manufacturing and technology",
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=response_class
     )
     
     # Add CORS middleware
@@ -119,15 +133,15 @@ def create_app() -> FastAPI:
             
             # Return appropriate HTTP status code
             if status["overall_status"] in ["error", "unhealthy"]:
-                return JSONResponse(status_code=503, content=status)
+                return response_class(status_code=503, content=status)
             elif status["overall_status"] == "warning":
-                return JSONResponse(status_code=200, content=status)
+                return response_class(status_code=200, content=status)
             else:
                 return status
                 
         except Exception as e:
             logger.error(f"Error in health check: {e}")
-            return JSONResponse(
+            return response_class(
                 status_code=500,
                 content={"error": "Health check failed", "details": str(e)}
             )
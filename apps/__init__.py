@@ -0,0 +1,21 @@
+"""
+Hub Apps Package
+Sub-apps are imported on first attribute access (e.g. `apps.semiconductor_app`)
+"""
+
+import importlib
+
+def __getattr__(name):
+    """Import the `name` sub-app on first access; later lookups hit the module dict"""
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        module = importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise  # The app exists but one of its own imports is missing
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    globals()[name] = module
+    return module
@@ -21,8 +21,7 @@ def main():
         # Import the main app functions from streamlit_demo_simple
         from streamlit_demo_simple import (
             show_dashboard, show_rag_query, show_knowledge_base,
-            show_web_crawling, show_system_monitor, show_analytics,
-            openai_client
+            show_web_crawling, show_system_monitor, show_analytics
         )
         
         # Mini navigation for semiconductor app
@@ -3,6 +3,6 @@ Core package initialization
 """
 
 from .config import config, Config
-from .database import DatabaseManager
+from .database import DatabaseManager, DocResult
 
-__all__ = ["config", "Config", "DatabaseManager"]
+__all__ = ["config", "Config", "DatabaseManager", "DocResult"]
@@ -53,6 +53,8 @@ class Config(BaseSettings if BaseSettings != object else object):
     chunk_overlap: int = Field(default=200, env="CHUNK_OVERLAP")
     top_k_results: int = Field(default=10, env="TOP_K_RESULTS")
     similarity_threshold: float = Field(default=0.7, env="SIMILARITY_THRESHOLD")
+    semantic_cache_size: int = Field(default=1000, env="SEMANTIC_CACHE_SIZE")
+    semantic_cache_threshold: float = Field(default=0.95, env="SEMANTIC_CACHE_THRESHOLD")
     
     # Model Configuration
     embedding_model: str = Field(
@@ -25,6 +25,40 @@ from .config import config
 
 logger = logging.getLogger(__name__)
 
+class DocResult:
+    """A single document returned from a vector database query"""
+    # Hand-written __slots__ rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("content", "metadata", "distance", "relevance_score", "collection", "id")
+    
+    def __init__(
+        self,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        distance: float = 0.0,
+        relevance_score: float = 0.0,
+        collection: Optional[str] = None,
+        id: Optional[str] = None
+    ):
+        self.content = content
+        self.metadata = metadata if metadata is not None else {}
+        self.distance = distance
+        self.relevance_score = relevance_score
+        self.collection = collection
+        self.id = id
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"DocResult({fields})"
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DocResult):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict copy of the result, e.g. for JSON responses"""
+        return {name: (dict(self.metadata) if name == "metadata" else getattr(self, name)) for name in self.__slots__}
+
 class DatabaseManager:
     """Manages all database operations for the system"""
     
@@ -32,6 +66,8 @@ class DatabaseManager:
         self.chroma_client = None
         self.collections = {}
         self.sqlite_db_path = Path("./data/metadata.db")
+        # Bumped whenever documents are added so query caches can invalidate
+        self.corpus_version = 0
         
     async def initialize(self):
         """Initialize all database connections"""
@@ -178,6 +214,7 @@ class DatabaseManager:
                 metadatas=metadatas
             )
             
+            self.corpus_version += 1
             logger.info(f"Added {len(documents)} documents to {collection_name}")
             return True
             
@@ -190,7 +227,7 @@ class DatabaseManager:
         query_text: str, 
         collection_name: str = "documents",
         n_results: int = 10
-    ) -> List[Dict[str, Any]]:
+    ) -> List[DocResult]:
         """Query documents from the vector database"""
         if not self.chroma_client or collection_name not in self.collections:
             logger.warning(f"Collection {collection_name} not available")
@@ -209,12 +246,15 @@ class DatabaseManager:
             formatted_results = []
             if results["documents"]:
                 for i, doc in enumerate(results["documents"][0]):
-                    formatted_results.append({
-                        "content": doc,
-                        "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                        "distance": results["distances"][0][i] if results["distances"] else 0.0,
-                        "relevance_score": 1 - (results["distances"][0][i] if results["distances"] else 0.0)
-                    })
+                    distance = results["distances"][0][i] if results["distances"] else 0.0
+                    formatted_results.append(DocResult(
+                        content=doc,
+                        metadata=results["metadatas"][0][i] if results["metadatas"] else {},
+                        distance=distance,
+                        relevance_score=1 - distance,
+                        collection=collection_name,
+                        id=results["ids"][0][i] if results.get("ids") else None
+                    ))
             
             return formatted_results
             
@@ -245,6 +285,28 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Failed to log crawl session: {e}")
     
+    async def warm_up(self):
+        """Touch each store once so the first real query doesn't pay cold-start cost"""
+        def _warm_sqlite():
+            with sqlite3.connect(self.sqlite_db_path) as conn:
+                conn.execute("SELECT 1").fetchone()
+        
+        tasks = [asyncio.to_thread(_warm_sqlite)] if sqlite3 else []
+        
+        # Counting a collection loads its segment files and index from disk
+        tasks.extend(
+            asyncio.to_thread(collection.count)
+            for collection in self.collections.values()
+        )
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        errors = [result for result in results if isinstance(result, Exception)]
+        for error in errors:
+            logger.warning(f"Database warm-up step failed: {error}")
+        
+        logger.info(f"Database warm-up completed ({len(tasks) - len(errors)}/{len(tasks)} stores ready)")
+    
     async def get_system_stats(self) -> Dict[str, Any]:
         """Get system statistics"""
         stats = {}
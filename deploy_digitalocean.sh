@@ -18,6 +18,9 @@ source venv/bin/activate
 # Install dependencies
 pip install -r requirements.txt
 
+# Precompile hub apps so cold starts load cached bytecode instead of compiling
+python -m compileall -q apps
+
 # Set environment variables
 export OPENAI_API_KEY="your-api-key-here"
 
@@ -132,10 +132,10 @@ class TrainingManager:
                     
                     for doc in sample_docs:
                         training_data.append({
-                            "text": doc.get("content", ""),
-                            "metadata": doc.get("metadata", {}),
+                            "text": doc.content,
+                            "metadata": doc.metadata,
                             "collection": collection_name,
-                            "relevance_score": doc.get("relevance_score", 0.0)
+                            "relevance_score": doc.relevance_score
                         })
                         
                 except Exception as e:
@@ -332,7 +332,7 @@ class TrainingManager:
                     )
                     
                     if results:
-                        avg_relevance = sum(r.get("relevance_score", 0) for r in results) / len(results)
+                        avg_relevance = sum(r.relevance_score for r in results) / len(results)
                         total_relevance += avg_relevance
                         total_queries += 1
                         
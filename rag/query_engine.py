@@ -2,10 +2,13 @@
 RAG Query Engine for semiconductor knowledge retrieval
 """
 
+import asyncio
 import logging
+import threading
 from datetime import datetime
+from hashlib import blake2b
+from operator import attrgetter
 from typing import Dict, List, Optional, Any, NamedTuple
-import json
 
 try:
     from langchain.text_splitter import RecursiveCharacterTextSplitter
@@ -18,8 +21,13 @@ except ImportError:
     SentenceTransformer = None
     openai = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from core.config import config
-from core.database import db_manager
+from core.database import db_manager, DocResult
 
 logger = logging.getLogger(__name__)
 
@@ -36,15 +44,24 @@ class RAGQueryEngine:
     def __init__(self):
         self.embedding_model = None
         self.text_splitter = None
+        # Guards lazy model loading and the semantic cache; the engine is shared
+        # across threads (Streamlit sessions, scheduler jobs). Reentrant because
+        # cache lookups/stores may call clear_cache().
+        self._lock = threading.RLock()
+        
+        # Semantic retrieval cache: ring buffer of normalized query embeddings
+        # plus the retrieval result and parameters each one was computed with
+        self._cache_embeddings = None
+        self._cache_entries = []
+        self._cache_next = 0
+        self._cache_corpus_version = db_manager.corpus_version
+        
         self._initialize_models()
     
     def _initialize_models(self):
-        """Initialize the embedding and text processing models"""
+        """Initialize the text processing models"""
+        # The embedding model is loaded on first query, see _ensure_embedding_model
         try:
-            if SentenceTransformer:
-                self.embedding_model = SentenceTransformer(config.embedding_model)
-                logger.info(f"Loaded embedding model: {config.embedding_model}")
-            
             if RecursiveCharacterTextSplitter:
                 self.text_splitter = RecursiveCharacterTextSplitter(
                     chunk_size=config.chunk_size,
@@ -56,6 +73,19 @@ class RAGQueryEngine:
         except Exception as e:
             logger.error(f"Failed to initialize models: {e}")
     
+    def _ensure_embedding_model(self):
+        """Load the embedding model on first use (thread-safe)"""
+        if self.embedding_model is None and SentenceTransformer:
+            with self._lock:
+                if self.embedding_model is None:
+                    try:
+                        self.embedding_model = SentenceTransformer(config.embedding_model)
+                        logger.info(f"Loaded embedding model: {config.embedding_model}")
+                    except Exception as e:
+                        logger.error(f"Failed to load embedding model: {e}")
+        
+        return self.embedding_model
+    
     async def query(
         self, 
         question: str, 
@@ -100,7 +130,7 @@ class RAGQueryEngine:
             confidence = self._calculate_confidence(relevant_docs, answer)
             
             # Step 4: Prepare sources if requested
-            sources = relevant_docs if include_sources else []
+            sources = [doc.to_dict() for doc in relevant_docs] if include_sources else []
             
             processing_time = (datetime.now() - start_time).total_seconds()
             
@@ -125,13 +155,22 @@ class RAGQueryEngine:
         query: str, 
         max_sources: int = 10,
         collections: Optional[List[str]] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[DocResult]:
         """Retrieve relevant documents from the knowledge base"""
+        # Loading and encoding are blocking (seconds for the first load), so keep them off the event loop
+        await asyncio.to_thread(self._ensure_embedding_model)
         
         # Default collections if none specified
         if collections is None:
             collections = ["documents", "research_papers", "news_articles", "patents", "historical_data"]
         
+        # Paraphrases of a recent query reuse its retrieval result
+        cache_key = (max_sources, tuple(collections))
+        query_embedding = await asyncio.to_thread(self._embed_query, query)
+        cached = self._lookup_cached_retrieval(query_embedding, cache_key)
+        if cached is not None:
+            return cached
+        
         all_results = []
         
         # Query each collection
@@ -145,25 +184,131 @@ class RAGQueryEngine:
                 
                 # Add collection info to results
                 for result in results:
-                    result["collection"] = collection_name
-                    all_results.append(result)
+                    result.collection = collection_name
+                all_results.extend(results)
                     
             except Exception as e:
                 logger.warning(f"Error querying collection {collection_name}: {e}")
                 continue
         
-        # Sort by relevance score and take top results
-        all_results.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
+        # The same article is often indexed in several collections
+        unique_results = self._deduplicate_results(all_results)
         
-        # Filter by similarity threshold
-        filtered_results = [
-            result for result in all_results
-            if result.get("relevance_score", 0) >= config.similarity_threshold
-        ]
+        top_results = self._select_top_results(unique_results, max_sources)
+        self._store_cached_retrieval(query_embedding, cache_key, top_results)
         
-        return filtered_results[:max_sources]
+        return top_results
     
-    async def _generate_answer(self, question: str, context_docs: List[Dict[str, Any]]) -> str:
+    def _embed_query(self, query: str):
+        """Embed a query for the semantic cache, or None if unavailable"""
+        if np is None or self.embedding_model is None or config.semantic_cache_size <= 0:
+            return None
+        
+        try:
+            embedding = self.embedding_model.encode(query, normalize_embeddings=True)
+            return np.asarray(embedding, dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Failed to embed query for cache lookup: {e}")
+            return None
+    
+    def _lookup_cached_retrieval(self, query_embedding, cache_key) -> Optional[List[DocResult]]:
+        """Return a cached retrieval for a semantically similar query, if any"""
+        if query_embedding is None:
+            return None
+        
+        with self._lock:
+            if not self._cache_entries:
+                return None
+            
+            # New documents may change what a query should retrieve
+            if self._cache_corpus_version != db_manager.corpus_version:
+                self.clear_cache()
+                return None
+            
+            # Embeddings are normalized, so one matmul gives all cosine similarities
+            similarities = self._cache_embeddings[:len(self._cache_entries)] @ query_embedding
+            
+            for index in np.argsort(-similarities):
+                if similarities[index] < config.semantic_cache_threshold:
+                    break
+                entry_key, results = self._cache_entries[index]
+                if entry_key == cache_key:
+                    return list(results)
+        
+        return None
+    
+    def _store_cached_retrieval(self, query_embedding, cache_key, results: List[DocResult]):
+        """Add a retrieval result to the semantic cache, evicting the oldest entry"""
+        if query_embedding is None:
+            return
+        
+        with self._lock:
+            if self._cache_corpus_version != db_manager.corpus_version:
+                self.clear_cache()
+            
+            size = config.semantic_cache_size
+            if self._cache_embeddings is None:
+                self._cache_embeddings = np.zeros((size, query_embedding.shape[0]), dtype=np.float32)
+            
+            index = self._cache_next
+            self._cache_embeddings[index] = query_embedding
+            entry = (cache_key, list(results))
+            if index < len(self._cache_entries):
+                self._cache_entries[index] = entry
+            else:
+                self._cache_entries.append(entry)
+            
+            self._cache_next = (index + 1) % size
+    
+    def clear_cache(self):
+        """Drop all cached retrieval results"""
+        with self._lock:
+            self._cache_entries = []
+            self._cache_next = 0
+            self._cache_corpus_version = db_manager.corpus_version
+    
+    def _deduplicate_results(self, results: List[DocResult]) -> List[DocResult]:
+        """Drop results with duplicate content, keeping the most relevant copy"""
+        best_by_hash: Dict[bytes, DocResult] = {}
+        
+        for result in results:
+            # Hash only the leading content; mirrored copies share it verbatim
+            key = blake2b(result.content[:256].encode("utf-8"), digest_size=8).digest()
+            current = best_by_hash.get(key)
+            if current is None or result.relevance_score > current.relevance_score:
+                best_by_hash[key] = result
+        
+        return list(best_by_hash.values())
+    
+    def _select_top_results(self, results: List[DocResult], max_sources: int) -> List[DocResult]:
+        """Filter results by similarity threshold and return the top max_sources by relevance"""
+        if not results:
+            return []
+        
+        if np is None:
+            filtered_results = [
+                result for result in results
+                if result.relevance_score >= config.similarity_threshold
+            ]
+            filtered_results.sort(key=attrgetter("relevance_score"), reverse=True)
+            return filtered_results[:max_sources]
+        
+        # Work on a contiguous score array and only touch the results that make the cut
+        scores = np.fromiter(
+            (result.relevance_score for result in results),
+            dtype=np.float32,
+            count=len(results)
+        )
+        candidates = np.flatnonzero(scores >= config.similarity_threshold)
+        
+        if len(candidates) > max_sources:
+            top = np.argpartition(-scores[candidates], max_sources)[:max_sources]
+            candidates = candidates[top]
+        
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [results[i] for i in order]
+    
+    async def _generate_answer(self, question: str, context_docs: List[DocResult]) -> str:
         """Generate an answer using the retrieved context"""
         
         if not openai or not config.openai_api_key:
@@ -221,7 +366,7 @@ Please provide a comprehensive answer that includes:
             logger.error(f"Error generating answer with OpenAI: {e}")
             return self._generate_fallback_answer(question, context_docs)
     
-    def _generate_fallback_answer(self, question: str, context_docs: List[Dict[str, Any]]) -> str:
+    def _generate_fallback_answer(self, question: str, context_docs: List[DocResult]) -> str:
         """Generate a fallback answer when LLM is not available"""
         
         if not context_docs:
@@ -230,46 +375,50 @@ Please provide a comprehensive answer that includes:
         # Simple extractive approach - find most relevant chunks
         relevant_text = []
         for doc in context_docs[:3]:  # Use top 3 most relevant docs
-            content = doc.get("content", "")
+            content = doc.content
             if len(content) > 200:
                 # Take first part of content
                 relevant_text.append(content[:500] + "...")
             else:
                 relevant_text.append(content)
         
-        answer = f"Based on the available information about semiconductor manufacturing:\n\n"
-        answer += "\n\n".join(relevant_text)
+        parts = [
+            "Based on the available information about semiconductor manufacturing:\n\n",
+            "\n\n".join(relevant_text)
+        ]
         
-        # Add source information
+        # Add source information (ordered, without duplicates)
         sources = []
+        seen_sources = set()
         for doc in context_docs[:3]:
-            metadata = doc.get("metadata", {})
+            metadata = doc.metadata or {}
             source = metadata.get("source", "Unknown source")
-            if source not in sources:
+            if source not in seen_sources:
+                seen_sources.add(source)
                 sources.append(source)
         
         if sources:
-            answer += f"\n\nSources: {', '.join(sources)}"
+            parts.append(f"\n\nSources: {', '.join(sources)}")
         
-        return answer
+        return "".join(parts)
     
-    def _prepare_context(self, docs: List[Dict[str, Any]], max_length: int = 4000) -> str:
+    def _prepare_context(self, docs: List[DocResult], max_length: int = 4000) -> str:
         """Prepare context string from retrieved documents"""
         context_parts = []
         current_length = 0
         
         for doc in docs:
-            content = doc.get("content", "")
-            metadata = doc.get("metadata", {})
-            
-            # Add source information
-            source_info = f"Source: {metadata.get('source', 'Unknown')}"
-            if metadata.get("title"):
-                source_info += f" - {metadata['title']}"
-            if metadata.get("timestamp"):
-                source_info += f" ({metadata['timestamp'][:10]})"  # Just the date
+            metadata = doc.metadata or {}
+            title = metadata.get("title")
+            timestamp = metadata.get("timestamp")
             
-            doc_text = f"{source_info}\n{content}\n"
+            # Source line (with optional title and date) and content in one string
+            doc_text = (
+                f"Source: {metadata.get('source', 'Unknown')}"
+                f"{' - ' + title if title else ''}"
+                f"{' (' + timestamp[:10] + ')' if timestamp else ''}"
+                f"\n{doc.content}\n"
+            )
             
             if current_length + len(doc_text) > max_length:
                 # Truncate if needed
@@ -284,7 +433,7 @@ Please provide a comprehensive answer that includes:
         
         return "\n---\n".join(context_parts)
     
-    def _calculate_confidence(self, docs: List[Dict[str, Any]], answer: str) -> float:
+    def _calculate_confidence(self, docs: List[DocResult], answer: str) -> float:
         """Calculate confidence score for the answer"""
         if not docs:
             return 0.0
@@ -295,17 +444,20 @@ Please provide a comprehensive answer that includes:
         # 3. Answer length (longer = more detailed = higher confidence)
         
         num_docs = len(docs)
-        avg_relevance = sum(doc.get("relevance_score", 0) for doc in docs) / num_docs
-        answer_length_factor = min(len(answer) / 500, 1.0)  # Normalize to 0-1
-        
-        # Weighted combination
-        confidence = (
-            (num_docs / 10) * 0.3 +  # Number of docs (max 10)
-            avg_relevance * 0.5 +     # Average relevance
-            answer_length_factor * 0.2 # Answer completeness
-        )
+        if np is not None:
+            avg_relevance = float(np.fromiter(
+                (doc.relevance_score for doc in docs), dtype=np.float32, count=num_docs
+            ).mean())
+        else:
+            avg_relevance = sum(doc.relevance_score for doc in docs) / num_docs
         
-        return min(confidence, 1.0)
+        # Weighted combination (0.03 = 0.3 / 10 docs, 0.002 = 1 / 500 chars)
+        return min(
+            0.03 * num_docs +                          # Number of docs (max 10)
+            0.5 * avg_relevance +                      # Average relevance
+            0.2 * min(len(answer) * 0.002, 1.0),       # Answer completeness
+            1.0
+        )
     
     async def get_historical_timeline(self, topic: str = "semiconductor manufacturing") -> Dict[str, Any]:
         """Get a historical timeline for a specific semiconductor topic"""
@@ -318,8 +470,8 @@ Please provide a comprehensive answer that includes:
         # Extract timeline information
         timeline_events = []
         for doc in docs:
-            content = doc.get("content", "")
-            metadata = doc.get("metadata", {})
+            content = doc.content
+            metadata = doc.metadata
             
             # Simple year extraction (this could be more sophisticated)
             import re
@@ -330,7 +482,7 @@ Please provide a comprehensive answer that includes:
                     "year": int(year),
                     "content": content[:200] + "...",
                     "source": metadata.get("source", "Unknown"),
-                    "relevance": doc.get("relevance_score", 0)
+                    "relevance": doc.relevance_score
                 })
         
         # Sort by year
@@ -22,6 +22,14 @@ except ImportError:
     IntervalTrigger = None
     schedule = None
 
+# Use libuv-based event loops for the I/O-heavy jobs when available; this
+# also covers the persistent job loop, which is created via the policy
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
 from core.config import config
 from core.database import db_manager
 from crawlers.crawler_manager import crawler_manager
@@ -36,6 +44,8 @@ class MainScheduler:
         self.is_running = False
         self.background_thread = None
         self._shutdown_event = threading.Event()
+        self._job_loop = None
+        self._job_loop_thread = None
         
     def start(self):
         """Start the scheduler"""
@@ -79,6 +89,10 @@ class MainScheduler:
         # Parse cron-like schedules into schedule library format
         self._schedule_basic_jobs()
         
+        # Persistent event loop shared by all async jobs so client state
+        # (HTTP connection pools, DB clients) survives between runs
+        self._start_job_loop()
+        
         # Start scheduler in background thread
         self.background_thread = threading.Thread(target=self._run_basic_scheduler)
         self.background_thread.daemon = True
@@ -165,22 +179,52 @@ class MainScheduler:
     def _run_basic_scheduler(self):
         """Run the basic scheduler in a background thread"""
         while not self._shutdown_event.is_set():
+            # Sleep until the next job is due; the event wakes us early on shutdown
+            next_run = schedule.next_run()
+            if next_run:
+                wait_seconds = max(0, (next_run - datetime.now()).total_seconds())
+            else:
+                wait_seconds = 60
+
+            if self._shutdown_event.wait(timeout=wait_seconds):
+                break
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+    
+    def _start_job_loop(self):
+        """Start the background event loop used to run async jobs"""
+        if self._job_loop is not None:
+            return
+        
+        self._job_loop = asyncio.new_event_loop()
+        self._job_loop_thread = threading.Thread(
+            target=self._job_loop.run_forever,
+            name="scheduler-job-loop",
+            daemon=True
+        )
+        self._job_loop_thread.start()
+    
+    def _stop_job_loop(self):
+        """Stop the background event loop and release its resources"""
+        if self._job_loop is None:
+            return
+        
+        self._job_loop.call_soon_threadsafe(self._job_loop.stop)
+        self._job_loop_thread.join(timeout=10)
+        if self._job_loop_thread.is_alive():
+            # A job is still running; closing a running loop raises, so leave the daemon thread
+            logger.warning("Job event loop did not stop within 10s; leaving it to exit with the process")
+        else:
+            self._job_loop.close()
+        self._job_loop = None
+        self._job_loop_thread = None
     
     def _async_job_wrapper(self, async_func):
         """Wrapper to run async functions in the basic scheduler"""
-        def wrapper():
-            try:
-                # Create new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(async_func())
-                loop.close()
-            except Exception as e:
-                logger.error(f"Error in scheduled job: {e}")
-        
-        return wrapper()
+        try:
+            future = asyncio.run_coroutine_threadsafe(async_func(), self._job_loop)
+            future.result()
+        except Exception as e:
+            logger.error(f"Error in scheduled job: {e}")
     
     async def _run_crawling_job(self):
         """Execute the crawling job"""
@@ -261,6 +305,8 @@ class MainScheduler:
                 self._shutdown_event.set()
                 self.background_thread.join(timeout=10)
             
+            self._stop_job_loop()
+            
             self.is_running = False
             logger.info("Scheduler stopped successfully")
             
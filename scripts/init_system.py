@@ -3,38 +3,97 @@ System initialization script
 """
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
 from core.config import config
-from core.database import db_manager
+
+def _configure_logging():
+    """Configure logging so records are written by a background listener thread"""
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        # Already configured by the caller (same rule as logging.basicConfig)
+        return None
+    
+    # One formatter instance shared by every handler; skip millisecond formatting
+    formatter = logging.Formatter('{asctime} - {name} - {levelname} - {message}', style='{')
+    formatter.default_msec_format = None
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    handlers = [stream_handler]
+    
+    try:
+        file_handler = logging.FileHandler(config.log_file)
+    except FileNotFoundError:
+        # Log directory doesn't exist (yet); log to stdout only
+        file_handler = None
+    
+    if file_handler is not None:
+        # Batch file writes; flush every 512 records or immediately on errors
+        file_handler.setFormatter(formatter)
+        handlers.append(logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        ))
+    
+    log_queue = queue.Queue(-1)
+    root_logger.setLevel(getattr(logging, config.log_level))
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    
+    # Drain the queue on exit; logging.shutdown then flushes the MemoryHandler
+    atexit.register(listener.stop)
+    
+    return listener
 
 # Configure logging
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(config.log_file) if Path(config.log_file).parent.exists() else logging.NullHandler()
-    ]
-)
+_log_listener = _configure_logging()
 
 logger = logging.getLogger(__name__)
 
-def validate_environment():
-    """Validate that all required environment variables and dependencies are set"""
-    issues = []
-    
+NEXT_STEPS_BANNER = f"""
+{"=" * 60}
+🎉 Semiconductor Learning System Initialized Successfully!
+{"=" * 60}
+
+Next steps:
+1. Start crawling data:
+   python main.py crawl
+
+2. Query the knowledge base:
+   python main.py query "How has EUV lithography evolved?"
+
+3. Start the API server:
+   python main.py server
+
+4. Start automated scheduling:
+   python main.py scheduler
+
+5. Check system status:
+   python main.py status
+
+{"=" * 60}
+"""
+
+def _iter_environment_issues():
+    """Yield environment problems, cheapest checks first"""
     # Check required configurations
     if not config.openai_api_key:
-        issues.append("OPENAI_API_KEY is not set")
+        yield "OPENAI_API_KEY is not set"
     
     # Check required directories can be created
     try:
         config.create_directories()
     except Exception as e:
-        issues.append(f"Cannot create required directories: {e}")
+        yield f"Cannot create required directories: {e}"
     
     # Check if we can write to log directory
     log_dir = Path(config.log_file).parent
@@ -42,21 +101,42 @@ def validate_environment():
         try:
             log_dir.mkdir(parents=True, exist_ok=True)
         except Exception as e:
-            issues.append(f"Cannot create log directory: {e}")
+            yield f"Cannot create log directory: {e}"
+
+def validate_environment(stop_at_first: bool = False):
+    """
+    Validate that all required environment variables and dependencies are set
+    
+    Args:
+        stop_at_first: Return as soon as one issue is found, skipping the
+            remaining (filesystem) checks
+    
+    Returns:
+        List of issue descriptions (empty if the environment is valid)
+    """
+    issues = _iter_environment_issues()
+    
+    if stop_at_first:
+        first_issue = next(issues, None)
+        return [first_issue] if first_issue else []
     
-    return issues
+    return list(issues)
 
 async def initialize_database():
     """Initialize the database system"""
     logger.info("Initializing database...")
     
     try:
+        # Imported here so environment validation doesn't pay for the DB stack
+        from core.database import db_manager
+        
         await db_manager.initialize()
+        await db_manager.warm_up()
         logger.info("Database initialized successfully")
         return True
         
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error("Failed to initialize database: %s", e)
         return False
 
 def setup_data_sources():
@@ -71,26 +151,24 @@ def setup_data_sources():
         
         # For now, we'll just validate that sources are configured
         data_sources = config.get_data_sources()
-        enabled_sources = [name for name, enabled in data_sources.items() if enabled]
+        enabled_sources = tuple(name for name, enabled in data_sources.items() if enabled)
         
         if not enabled_sources:
             logger.warning("No data sources are enabled")
             return False
         
-        logger.info(f"Configured data sources: {', '.join(enabled_sources)}")
+        logger.info("Configured data sources: %s", ", ".join(enabled_sources))
         return True
         
     except Exception as e:
-        logger.error(f"Failed to set up data sources: {e}")
+        logger.error("Failed to set up data sources: %s", e)
         return False
 
-def create_initial_directories():
+async def create_initial_directories():
     """Create all required directories"""
     logger.info("Creating required directories...")
     
     try:
-        config.create_directories()
-        
         # Additional directories for specific components
         additional_dirs = [
             "./cache/crawl",
@@ -101,14 +179,20 @@ def create_initial_directories():
             "./logs/training"
         ]
         
-        for dir_path in additional_dirs:
-            Path(dir_path).mkdir(parents=True, exist_ok=True)
+        # mkdir calls are independent blocking syscalls, so issue them concurrently
+        await asyncio.gather(
+            asyncio.to_thread(config.create_directories),
+            *(
+                asyncio.to_thread(Path(dir_path).mkdir, parents=True, exist_ok=True)
+                for dir_path in additional_dirs
+            )
+        )
         
         logger.info("All directories created successfully")
         return True
         
     except Exception as e:
-        logger.error(f"Failed to create directories: {e}")
+        logger.error("Failed to create directories: %s", e)
         return False
 
 async def run_initial_health_check():
@@ -124,17 +208,20 @@ async def run_initial_health_check():
             logger.info("Initial health check passed")
             return True
         else:
-            logger.warning(f"Health check status: {status['overall_status']}")
+            logger.warning("Health check status: %s", status["overall_status"])
             
-            # Log specific issues
-            for component, details in status.items():
-                if isinstance(details, dict) and details.get("status") != "healthy":
-                    logger.warning(f"{component}: {details}")
+            # Log specific issues in a single record
+            unhealthy = {
+                component: details for component, details in status.items()
+                if isinstance(details, dict) and details.get("status") != "healthy"
+            }
+            if unhealthy:
+                logger.warning("Unhealthy components: %s", unhealthy)
             
             return False
             
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return False
 
 async def initialize_system(force: bool = False) -> bool:
@@ -151,11 +238,12 @@ async def initialize_system(force: bool = False) -> bool:
     
     # Step 1: Validate environment
     logger.info("Step 1: Validating environment...")
-    env_issues = validate_environment()
+    # Without --force any issue aborts, so there's no point running every check
+    env_issues = validate_environment(stop_at_first=not force)
     if env_issues:
         logger.error("Environment validation failed:")
         for issue in env_issues:
-            logger.error(f"  - {issue}")
+            logger.error("  - %s", issue)
         
         if not force:
             logger.error("Use --force flag to proceed anyway")
@@ -165,7 +253,7 @@ async def initialize_system(force: bool = False) -> bool:
     
     # Step 2: Create directories
     logger.info("Step 2: Creating directories...")
-    if not create_initial_directories():
+    if not await create_initial_directories():
         logger.error("Failed to create required directories")
         return False
     
@@ -175,34 +263,26 @@ async def initialize_system(force: bool = False) -> bool:
         logger.error("Failed to initialize database")
         return False
     
-    # Step 4: Set up data sources
+    # Steps 4 and 5 are independent (config vs. system monitor), so run them together
     logger.info("Step 4: Setting up data sources...")
-    if not setup_data_sources():
+    logger.info("Step 5: Running initial health check...")
+    sources_ok, health_ok = await asyncio.gather(
+        asyncio.to_thread(setup_data_sources),
+        run_initial_health_check(),
+        return_exceptions=True
+    )
+    
+    if sources_ok is not True:
         logger.warning("Data source setup had issues, but continuing...")
     
-    # Step 5: Run health check
-    logger.info("Step 5: Running initial health check...")
-    if not await run_initial_health_check():
+    if health_ok is not True:
         logger.warning("Initial health check had issues, but system is initialized")
     
     logger.info("System initialization completed successfully!")
     
     # Print next steps
-    print("\n" + "="*60)
-    print("🎉 Semiconductor Learning System Initialized Successfully!")
-    print("="*60)
-    print("\nNext steps:")
-    print("1. Start crawling data:")
-    print("   python main.py crawl")
-    print("\n2. Query the knowledge base:")
-    print("   python main.py query \"How has EUV lithography evolved?\"")
-    print("\n3. Start the API server:")
-    print("   python main.py server")
-    print("\n4. Start automated scheduling:")
-    print("   python main.py scheduler")
-    print("\n5. Check system status:")
-    print("   python main.py status")
-    print("\n" + "="*60)
+    sys.stdout.write(NEXT_STEPS_BANNER)
+    sys.stdout.flush()
     
     return True
 
@@ -1,36 +1,104 @@
 # smarter_zen_chat.py
 
+from functools import lru_cache
+from threading import Thread
+
 import gradio as gr
-from langchain.chains import LLMChain
-from langchain.memory import ConversationBufferMemory
-from langchain.prompts import PromptTemplate
-from langchain_community.llms.huggingface_pipeline import HuggingFacePipeline
-from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline
+from langchain.memory import ConversationBufferWindowMemory
+from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig, TextIteratorStreamer, pipeline
 import torch
 
-# --- 1. Set up the LLM and LangChain Chain ---
+# --- 1. Set up the LLM and conversation memory ---
 
 # Let's use a model from Hugging Face that's good for conversation.
 # microsoft/DialoGPT-medium is a good starting point.
 # Note: This will download the model (about 1.5GB) the first time you run it.
 model_name = "microsoft/DialoGPT-medium"
 tokenizer = AutoTokenizer.from_pretrained(model_name)
-model = AutoModelForCausalLM.from_pretrained(model_name)
-
-# For better performance, use a GPU if available
-device = 0 if torch.cuda.is_available() else -1
 
-# Create a transformers pipeline
+# Load reduced-precision weights instead of the default FP32 (~1.5GB) on GPU:
+# int8 via bitsandbytes with `device_map` placing the model, or bfloat16 without
+# bitsandbytes. On CPU we keep FP32, since bf16 matmuls are slow or emulated there.
+try:
+    import bitsandbytes  # noqa: F401
+except ImportError:
+    bitsandbytes = None
+
+use_int8 = torch.cuda.is_available() and bitsandbytes is not None
+
+# Use fused FlashAttention 2 kernels on CUDA when `flash-attn` is installed.
+# Otherwise leave attention to transformers' default (SDPA on versions that
+# support it), since `attn_implementation` only exists from transformers 4.36.
+try:
+    import flash_attn  # noqa: F401
+except ImportError:
+    flash_attn = None
+
+use_flash_attn = torch.cuda.is_available() and flash_attn is not None
+
+
+def load_model(**kwargs):
+    """Load the chat model, requesting FlashAttention 2 when it is available."""
+    if use_flash_attn:
+        try:
+            return AutoModelForCausalLM.from_pretrained(
+                model_name, attn_implementation="flash_attention_2", **kwargs
+            )
+        except (TypeError, ValueError) as e:
+            print(f"FlashAttention 2 unavailable, using default attention: {e}")
+    return AutoModelForCausalLM.from_pretrained(model_name, **kwargs)
+
+
+if use_int8:
+    model = load_model(
+        device_map="auto",
+        torch_dtype=torch.float16,  # FlashAttention needs half-precision activations
+        quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+    )
+    pipeline_device_kwargs = {}  # placement already handled by device_map
+else:
+    model = load_model(
+        torch_dtype=torch.bfloat16 if torch.cuda.is_available() else torch.float32,
+    )
+    # For better performance, use a GPU if available
+    pipeline_device_kwargs = {"device": 0 if torch.cuda.is_available() else -1}
+
+# Reuse past key/values while decoding so each new token only attends once
+model.config.use_cache = True
+
+# Compile the forward pass (torch>=2.0) to cut per-token kernel launch overhead.
+# Only the forward is compiled so the pipeline still sees a regular HF model;
+# bitsandbytes int8 layers are left eager. The pipeline already runs generation
+# under no-grad/inference mode. Compilation is lazy, so it actually happens (and
+# can fail) in the warm-up call below.
+eager_forward = model.forward
+use_compile = hasattr(torch, "compile") and not use_int8
+if use_compile:
+    model.forward = torch.compile(eager_forward, mode="reduce-overhead", fullgraph=False)
+
+# Create a transformers pipeline.
+# `max_new_tokens` bounds each reply instead of decoding up to a 1000-token
+# total length, and DialoGPT has no pad token so we pad with EOS.
 chat_pipeline = pipeline(
     "text-generation",
     model=model,
     tokenizer=tokenizer,
-    device=device,
-    max_length=1000,
+    max_new_tokens=128,
+    do_sample=True,
+    pad_token_id=tokenizer.eos_token_id,
+    **pipeline_device_kwargs,
 )
 
-# Wrap the pipeline in a LangChain LLM
-llm = HuggingFacePipeline(pipeline=chat_pipeline)
+# Run one tiny generation at startup so CUDA kernel selection and the
+# torch.compile graph capture happen before the first user message.
+try:
+    chat_pipeline("warmup", max_new_tokens=1)
+except Exception as e:
+    if use_compile:
+        print(f"torch.compile failed, running eagerly: {e}")
+        model.forward = eager_forward
+    else:
+        print(f"Model warm-up skipped: {e}")
 
 # Create a prompt template to give our chatbot its "Zen" personality.
 # The template includes memory of the past conversation.
@@ -44,23 +112,24 @@ Avoid giving direct answers. Instead, guide the user with questions and short pa
 Human: {human_input}
 Zen Chatbot:"""
 
-prompt = PromptTemplate(
-    input_variables=["history", "human_input"],
-    template=template
-)
+# The Zen preamble never changes, so tokenize it once here and only tokenize
+# the conversation part of the prompt on each turn.
+preamble_text, conversation_template = template.split("{history}", 1)
+conversation_template = "{history}" + conversation_template
+PREAMBLE_IDS = tokenizer(preamble_text, return_tensors="pt").input_ids
+
+
+@lru_cache(maxsize=256)
+def _tokenize(text):
+    """Tokenize prompt text, reusing results for repeated prompts (examples, retries)."""
+    return tokenizer(text, return_tensors="pt").input_ids
 
 # Create a memory object to store the conversation history.
+# Only the last 6 exchanges are kept so the prompt stays bounded and well inside
+# DialoGPT's 1024-token context, however long the conversation runs.
 # For a real application, you might replace this with a database-backed memory
 # to persist conversations across sessions.
-memory = ConversationBufferMemory(memory_key="history")
-
-# Create the LLMChain
-zen_chain = LLMChain(
-    llm=llm,
-    prompt=prompt,
-    verbose=True,
-    memory=memory,
-)
+memory = ConversationBufferWindowMemory(memory_key="history", k=6)
 
 
 # --- 2. Define the function for Gradio ---
@@ -68,11 +137,47 @@ zen_chain = LLMChain(
 def zen_chat_response(message, history):
     """
     This function is called by the Gradio interface for each user message.
-    It uses the LangChain chain to generate a response.
+    It streams the reply token by token instead of waiting for the full
+    generation, and records the finished exchange in the chain's memory.
     """
-    # The `zen_chain` automatically uses the memory to include past conversation.
-    response = zen_chain.predict(human_input=message)
-    return response
+    # Build the Zen prompt including past conversation, reusing the
+    # pre-tokenized preamble.
+    history_text = memory.load_memory_variables({})["history"]
+    conversation_text = conversation_template.format(history=history_text, human_input=message)
+    conversation_ids = _tokenize(conversation_text)
+    input_ids = torch.cat([PREAMBLE_IDS, conversation_ids], dim=-1).to(model.device)
+
+    # Generate in a background thread; the streamer hands us text as it's decoded.
+    streamer = TextIteratorStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True)
+    errors = []
+
+    def generate():
+        try:
+            model.generate(
+                input_ids=input_ids,
+                attention_mask=torch.ones_like(input_ids),
+                streamer=streamer,
+                max_new_tokens=128,
+                do_sample=True,
+                pad_token_id=tokenizer.eos_token_id,
+            )
+        except BaseException as e:
+            # Unblock the loop below; the error is re-raised once the thread is joined
+            errors.append(e)
+            streamer.end()
+
+    generation = Thread(target=generate)
+    generation.start()
+
+    response = ""
+    for token_text in streamer:
+        response += token_text
+        yield response
+
+    generation.join()
+    if errors:
+        raise errors[0]
+    memory.save_context({"human_input": message}, {"text": response})
 
 
 # --- 3. Create and launch the Gradio UI ---
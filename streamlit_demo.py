@@ -6,31 +6,49 @@ A comprehensive web interface showcasing all system capabilities
 import streamlit as st
 import asyncio
 import sys
+import threading
 import os
 from pathlib import Path
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime, timedelta
 import json
-import time
+import re
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
-# Import our system components
+# Import our system components (heavier ones are loaded on demand below)
 try:
     from core.config import config
-    from core.database import db_manager
-    from core.system_monitor import system_monitor
-    from rag.query_engine import query_engine
-    from crawlers.crawler_manager import crawler_manager
-    from models.training_manager import training_manager
 except ImportError as e:
     st.error(f"Failed to import system components: {e}")
     st.stop()
 
+# Optional cross-process cache for demo fixtures
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+@st.cache_resource
+def _get_fixture_cache():
+    """Get the on-disk cache shared by all server processes"""
+    return diskcache.Cache(str(project_root / "cache" / "streamlit_demo"))
+
+def _disk_memoize(expire):
+    """Memoize a fixture builder on disk when diskcache is installed"""
+    if diskcache is None:
+        return lambda func: func
+    return _get_fixture_cache().memoize(expire=expire)
+
+# The system monitor is created once per server process and shared across reruns
+@st.cache_resource
+def get_system_monitor():
+    """Get the shared system monitor"""
+    from core.system_monitor import system_monitor
+    return system_monitor
+
 # Configure Streamlit page
 st.set_page_config(
     page_title="Semiconductor Learning System",
@@ -40,7 +58,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -67,11 +85,15 @@ st.markdown("""
         color: #dc3545;
         font-weight: bold;
     }
+    .status-info {
+        color: #1f77b4;
+        font-weight: bold;
+    }
     .sidebar-section {
         margin-bottom: 2rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 def initialize_system():
     """Initialize the system components"""
@@ -83,40 +105,35 @@ def initialize_system():
         st.error(f"System initialization failed: {e}")
         return False
 
+@st.cache_resource
+def _get_event_loop():
+    """Get a background event loop that lives for the whole server process"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="sls-event-loop", daemon=True).start()
+    return loop
+
 def run_async(func):
     """Helper to run async functions in Streamlit"""
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If there's already a running loop, create a new one in a thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, func)
-                return future.result()
-        else:
-            return loop.run_until_complete(func)
-    except RuntimeError:
-        return asyncio.run(func)
+    # Reuse one long-lived loop instead of creating (and tearing down) one per call
+    return asyncio.run_coroutine_threadsafe(func, _get_event_loop()).result()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_status():
+    """Fetch system status, reused across reruns for 30 seconds"""
+    return get_system_monitor().get_system_status()
 
 def get_system_status():
     """Get current system status"""
     try:
-        status = system_monitor.get_system_status()
+        status = _fetch_status()
         return status
     except Exception as e:
         return {"error": str(e)}
 
-def format_status_display(status_value):
-    """Format status for display with colors"""
-    if status_value == "healthy":
-        return f'<span class="status-healthy">✅ Healthy</span>'
-    elif status_value == "warning":
-        return f'<span class="status-warning">⚠️ Warning</span>'
-    elif status_value == "error":
-        return f'<span class="status-error">❌ Error</span>'
-    else:
-        return f'<span class="status-warning">❓ {status_value}</span>'
-
+# st.cache_data serves repeat calls within a process; diskcache shares the
+# fixtures between worker processes and across restarts
+@st.cache_data
+@_disk_memoize(expire=3600)
 def create_sample_data():
     """Create sample data for demonstration"""
     sample_documents = [
@@ -144,8 +161,184 @@ def create_sample_data():
     ]
     return sample_documents
 
+@st.cache_data
+def _docs_df():
+    """Sample documents as a columnar DataFrame, plus one row per (document, topic)"""
+    import pandas as pd
+    df = pd.DataFrame(create_sample_data())
+    df['source'] = df['source'].astype('category')
+    return df, df.explode('topics').reset_index()
+
+@st.cache_data
+@_disk_memoize(expire=3600)
+def _sources():
+    """Configured crawl data sources"""
+    return [
+        {"name": "ArXiv Papers", "url": "arxiv.org", "status": "active", "last_crawl": "2024-07-27 14:30"},
+        {"name": "IEEE Xplore", "url": "ieeexplore.ieee.org", "status": "active", "last_crawl": "2024-07-27 09:15"},
+        {"name": "Semiconductor News", "url": "various news sites", "status": "active", "last_crawl": "2024-07-28 08:00"},
+        {"name": "Patent Database", "url": "patents.google.com", "status": "inactive", "last_crawl": "2024-07-26 16:45"},
+        {"name": "Industry Reports", "url": "various industry sites", "status": "active", "last_crawl": "2024-07-27 20:30"}
+    ]
+
+@st.cache_data
+def _sources_df():
+    """Crawl data sources as a table"""
+    import pandas as pd
+    df = pd.DataFrame(_sources())
+    df['status'] = df['status'].map({'active': '🟢 Active', 'inactive': '🔴 Inactive'})
+    return df
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _recent_logs_df():
+    """Recent system log entries, polled at most every 5 seconds"""
+    import pandas as pd
+    sample_logs = [
+        {"timestamp": "2024-07-28 12:45:23", "level": "INFO", "message": "RAG query processed successfully"},
+        {"timestamp": "2024-07-28 12:44:15", "level": "INFO", "message": "Document added to knowledge base"},
+        {"timestamp": "2024-07-28 12:43:02", "level": "WARNING", "message": "API rate limit approaching"},
+        {"timestamp": "2024-07-28 12:42:18", "level": "INFO", "message": "Scheduled crawling started"},
+        {"timestamp": "2024-07-28 12:41:30", "level": "INFO", "message": "Health check completed"},
+    ]
+    return pd.DataFrame(sample_logs)
+
+def _health_block(title, items):
+    """Render a titled list of (css class, text) health indicators as HTML"""
+    rows = "".join(f'<div class="{css_class}">{text}</div>' for css_class, text in items)
+    return f"<p><strong>{title}</strong></p>{rows}"
+
+DASHBOARD_HEALTH_HTML = (
+    _health_block("🔗 API Connectivity", (
+        ("status-healthy", "✅ OpenAI API: Connected"),
+        ("status-info", "ℹ️ ChromaDB: Active"),
+        ("status-healthy", "✅ System Monitor: Running"),
+    )),
+    _health_block("💾 Storage Status", (
+        ("status-info", "ℹ️ Vector DB Size: 16.2 MB"),
+        ("status-healthy", "✅ Disk Space: 85% free"),
+        ("status-healthy", "✅ Memory Usage: Normal"),
+    )),
+    _health_block("🔄 Background Tasks", (
+        ("status-healthy", "✅ Scheduled Crawling: Active"),
+        ("status-info", "ℹ️ Model Training: Pending"),
+        ("status-healthy", "✅ Health Monitoring: Running"),
+    )),
+)
+
+DASHBOARD_QUERIES = (23, 31, 28, 45, 52, 38, 47, 42, 47)
+
+@st.cache_data
+def _dashboard_dates():
+    """Days covered by the dashboard query volume chart"""
+    import pandas as pd
+    return tuple(pd.date_range(start='2024-07-20', end='2024-07-28', freq='D')[:len(DASHBOARD_QUERIES)])
+
+# Chart builders are cached on their (hashable) inputs so reruns reuse the built figure.
+# Line charts use WebGL; browsers without WebGL support fall back to SVG.
+@st.cache_data(show_spinner=False)
+def _build_query_volume_fig(dates, queries):
+    """Build the daily query volume line chart"""
+    import plotly.express as px
+    fig = px.line(
+        x=dates,
+        y=queries,
+        title="Daily Query Volume",
+        labels={'x': 'Date', 'y': 'Number of Queries'},
+        render_mode='webgl'
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_kb_pie(categories, values):
+    """Build the document distribution pie chart"""
+    import plotly.express as px
+    return px.pie(
+        values=values,
+        names=categories,
+        title="Document Distribution by Category"
+    )
+
+def _resampled(fig):
+    """Wrap a line chart so only a viewport's worth of points is sent to the browser"""
+    # Optional server-side downsampling for line charts
+    try:
+        from plotly_resampler import FigureResampler
+    except ImportError:
+        return fig
+    return FigureResampler(fig)
+
+@st.cache_data(show_spinner=False)
+def _build_response_time_fig(times, response_times):
+    """Build the 24-hour response time line chart"""
+    import plotly.express as px
+    # plotly-resampler needs array data, not Python sequences
+    return _resampled(px.line(
+        x=np.asarray(times),
+        y=np.asarray(response_times),
+        title='24-Hour Response Time Trend',
+        labels={'x': 'Time', 'y': 'Response Time (ms)'},
+        render_mode='webgl'
+    ))
+
+@st.cache_data(show_spinner=False)
+def _build_topics_bar(topics, queries):
+    """Build the most queried topics bar chart"""
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Bar(x=queries, y=topics, orientation='h'))
+    # Stable uirevision keeps the user's zoom/pan across reruns
+    fig.update_layout(
+        title='Most Queried Topics',
+        xaxis_title='Queries',
+        yaxis_title='Topic',
+        uirevision='topics_bar'
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_geo_pie(countries, users):
+    """Build the user distribution pie chart"""
+    import plotly.express as px
+    return px.pie(values=users, names=countries, title='User Distribution by Country')
+
+@st.cache_data
+def _topics_data():
+    """Most queried topics for the analytics page"""
+    return {
+        'Topic': ('EUV Lithography', '3nm Process', 'AI in Manufacturing', 'Yield Optimization', 'Memory Technologies'),
+        'Queries': (45, 38, 32, 28, 22)
+    }
+
+@st.cache_data
+def _geo_data():
+    """User counts per country for the analytics page"""
+    return {
+        'Country': ('United States', 'Taiwan', 'South Korea', 'Japan', 'Germany', 'China'),
+        'Users': (156, 89, 67, 45, 34, 123)
+    }
+
+@st.cache_data
+def _trends_df():
+    """Weekly trend data for the analytics page"""
+    import pandas as pd
+    dates = pd.date_range(start='2024-01-01', end='2024-07-28', freq='W')
+    i = np.arange(len(dates))
+    return pd.DataFrame({
+        'Date': dates,
+        'Documents Added': 20 + i*2 + (i%4)*5,
+        'Queries Processed': 150 + i*10 + (i%3)*20,
+        'User Engagement': 0.7 + (i%10)*0.02
+    })
+
+@st.cache_data(show_spinner=False)
+def _build_trend_line(column, title):
+    """Build a weekly trend line chart for one column of the trend data"""
+    import plotly.express as px
+    return _resampled(px.line(_trends_df(), x='Date', y=column, title=title, render_mode='webgl'))
+
 def main():
     """Main Streamlit application"""
+    st.markdown(_CSS, unsafe_allow_html=True)
     
     # Header
     st.markdown('<h1 class="main-header">🔬 Semiconductor Learning System</h1>', unsafe_allow_html=True)
@@ -220,16 +413,7 @@ def show_dashboard():
     with col1:
         st.subheader("📈 Query Volume Trend")
         # Create sample data for the chart
-        dates = pd.date_range(start='2024-07-20', end='2024-07-28', freq='D')
-        queries = [23, 31, 28, 45, 52, 38, 47, 42, 47]
-        
-        fig = px.line(
-            x=dates[:len(queries)], 
-            y=queries,
-            title="Daily Query Volume",
-            labels={'x': 'Date', 'y': 'Number of Queries'}
-        )
-        fig.update_layout(showlegend=False)
+        fig = _build_query_volume_fig(_dashboard_dates(), DASHBOARD_QUERIES)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
@@ -237,48 +421,64 @@ def show_dashboard():
         categories = ['Research Papers', 'Industry Reports', 'News Articles', 'Patents', 'Technical Docs']
         values = [45, 28, 35, 18, 30]
         
-        fig = px.pie(
-            values=values,
-            names=categories,
-            title="Document Distribution by Category"
-        )
+        fig = _build_kb_pie(tuple(categories), tuple(values))
         st.plotly_chart(fig, use_container_width=True)
     
-    # System health indicators
+    # System health indicators, one markdown block per column
     st.subheader("🏥 System Health")
-    health_col1, health_col2, health_col3 = st.columns(3)
-    
-    with health_col1:
-        st.markdown("**🔗 API Connectivity**")
-        st.success("OpenAI API: Connected")
-        st.info("ChromaDB: Active")
-        st.success("System Monitor: Running")
-    
-    with health_col2:
-        st.markdown("**💾 Storage Status**")
-        st.info("Vector DB Size: 16.2 MB")
-        st.success("Disk Space: 85% free")
-        st.success("Memory Usage: Normal")
-    
-    with health_col3:
-        st.markdown("**🔄 Background Tasks**")
-        st.success("Scheduled Crawling: Active")
-        st.info("Model Training: Pending")
-        st.success("Health Monitoring: Running")
+    for column, html in zip(st.columns(3), DASHBOARD_HEALTH_HTML):
+        with column:
+            st.markdown(html, unsafe_allow_html=True)
 
 def show_rag_system():
     """Show RAG query interface"""
     st.header("🤖 RAG Query System")
     st.markdown("Ask questions about semiconductor manufacturing, and get AI-powered answers backed by industry knowledge.")
     
-    # Query interface
+    _render_query_panel()
+    
+    # Sample queries
+    st.subheader("💡 Sample Queries")
+    sample_queries = [
+        "What is EUV lithography and why is it important?",
+        "How has semiconductor manufacturing evolved over the past 30 years?",
+        "What are the main challenges in 3nm process node development?",
+        "How does AI improve semiconductor yield optimization?",
+        "What are the key differences between TSMC and Samsung's 3nm processes?"
+    ]
+    
+    st.selectbox(
+        "📝 Pick a sample query:",
+        [""] + sample_queries,
+        key="sample_select",
+        on_change=_use_sample_query
+    )
+
+# st.fragment (Streamlit >= 1.37) reruns only the decorated panel when its own widgets change
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+async def _do_query(query):
+    """Process a query (simulated; stands in for `query_engine.query`)"""
+    # Simulate query processing
+    await asyncio.sleep(2)
+    return simulate_rag_response(query)
+
+@st.cache_data(show_spinner=False)
+def _run_rag_query(query):
+    """Run a RAG query on the shared event loop, once per unique question"""
+    return run_async(_do_query(query))
+
+@_fragment
+def _render_query_panel():
+    """Render the query box, options and answer; option changes rerun only this panel"""
     col1, col2 = st.columns([3, 1])
     
     with col1:
         user_query = st.text_area(
             "Enter your question:",
             placeholder="e.g., What are the main challenges in EUV lithography?",
-            height=100
+            height=100,
+            key="user_query"
         )
     
     with col2:
@@ -289,46 +489,51 @@ def show_rag_system():
     
     if st.button("🔍 Query System", type="primary"):
         if user_query.strip():
-            with st.spinner("Processing your query..."):
-                # Simulate query processing
-                time.sleep(2)
-                
-                # Mock response for demonstration
-                response = simulate_rag_response(user_query)
-                
-                st.subheader("📖 Answer")
-                st.write(response['answer'])
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Confidence Score", f"{response['confidence']:.2f}")
-                with col2:
-                    st.metric("Processing Time", f"{response['processing_time']:.3f}s")
-                
-                if include_sources and response['sources']:
-                    st.subheader("📚 Sources")
-                    for i, source in enumerate(response['sources'][:max_sources], 1):
-                        with st.expander(f"Source {i}: {source['title']}"):
-                            st.write(f"**Source:** {source['source']}")
-                            st.write(f"**Date:** {source['date']}")
-                            st.write(f"**Relevance:** {source['relevance']:.2f}")
-                            st.write(source['excerpt'])
+            # Keep the answer on screen while the options are adjusted
+            st.session_state["rag_query"] = user_query
         else:
+            st.session_state.pop("rag_query", None)
             st.warning("Please enter a question to query the system.")
     
-    # Sample queries
-    st.subheader("💡 Sample Queries")
-    sample_queries = [
-        "What is EUV lithography and why is it important?",
-        "How has semiconductor manufacturing evolved over the past 30 years?",
-        "What are the main challenges in 3nm process node development?",
-        "How does AI improve semiconductor yield optimization?",
-        "What are the key differences between TSMC and Samsung's 3nm processes?"
-    ]
+    if st.session_state.get("rag_query"):
+        _render_response(st.session_state["rag_query"], include_sources, max_sources)
+
+def _render_response(query, include_sources, max_sources):
+    """Render the answer, metrics and sources for a query"""
+    with st.status("Processing your query...") as status:
+        # Mock response for demonstration
+        response = _run_rag_query(query)
+        status.update(label="Query processed", state="complete")
     
-    for query in sample_queries:
-        if st.button(f"📝 {query}", key=f"sample_{hash(query)}"):
-            st.text_area("Query:", value=query, height=60, key=f"demo_query_{hash(query)}")
+    st.subheader("📖 Answer")
+    st.write(response['answer'])
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Confidence Score", f"{response['confidence']:.2f}")
+    with col2:
+        st.metric("Processing Time", f"{response['processing_time']:.3f}s")
+    
+    if include_sources and response['sources']:
+        st.subheader("📚 Sources")
+        for i, source in enumerate(response['sources'][:max_sources], 1):
+            with st.expander(f"Source {i}: {source['title']}"):
+                st.write(f"**Source:** {source['source']}")
+                st.write(f"**Date:** {source['date']}")
+                st.write(f"**Relevance:** {source['relevance']:.2f}")
+                st.write(source['excerpt'])
+
+def _use_sample_query():
+    """Copy the chosen sample query into the question box"""
+    # Runs as a widget callback, i.e. before the text area is created on the next run
+    choice = st.session_state.get("sample_select")
+    if choice:
+        st.session_state["user_query"] = choice
+
+# Keyword patterns checked in order; the first match picks the canned response
+_KEYWORD_PATTERNS = (
+    (re.compile(r"euv|lithography", re.IGNORECASE), "euv lithography"),
+)
 
 def simulate_rag_response(query):
     """Simulate a RAG response for demonstration"""
@@ -357,25 +562,25 @@ def simulate_rag_response(query):
     }
     
     # Simple keyword matching for demo
-    query_lower = query.lower()
-    if "euv" in query_lower or "lithography" in query_lower:
-        return sample_responses["euv lithography"]
-    else:
-        # Generic response
-        return {
-            "answer": f"Based on the available semiconductor knowledge base, here's what I can tell you about '{query}': This is a sophisticated query that would benefit from more specific documentation in our knowledge base. The semiconductor industry is constantly evolving, and this topic represents an important area of ongoing research and development. For the most current information, I recommend checking the latest industry publications and technical papers.",
-            "confidence": 0.65,
-            "processing_time": 0.876,
-            "sources": [
-                {
-                    "title": "Semiconductor Industry Overview",
-                    "source": "Industry Analysis Report",
-                    "date": "2024-03-01",
-                    "relevance": 0.72,
-                    "excerpt": "The semiconductor industry continues to advance rapidly with new technologies and processes..."
-                }
-            ]
-        }
+    for pattern, response_key in _KEYWORD_PATTERNS:
+        if pattern.search(query):
+            return sample_responses[response_key]
+    
+    # Generic response
+    return {
+        "answer": f"Based on the available semiconductor knowledge base, here's what I can tell you about '{query}': This is a sophisticated query that would benefit from more specific documentation in our knowledge base. The semiconductor industry is constantly evolving, and this topic represents an important area of ongoing research and development. For the most current information, I recommend checking the latest industry publications and technical papers.",
+        "confidence": 0.65,
+        "processing_time": 0.876,
+        "sources": [
+            {
+                "title": "Semiconductor Industry Overview",
+                "source": "Industry Analysis Report",
+                "date": "2024-03-01",
+                "relevance": 0.72,
+                "excerpt": "The semiconductor industry continues to advance rapidly with new technologies and processes..."
+            }
+        ]
+    }
 
 def show_knowledge_base():
     """Show knowledge base browser"""
@@ -383,42 +588,43 @@ def show_knowledge_base():
     st.markdown("Explore the documents and knowledge stored in the system.")
     
     # Sample data
-    sample_docs = create_sample_data()
+    docs_df, topics_df = _docs_df()
     
     # Filters
     col1, col2, col3 = st.columns(3)
     with col1:
         source_filter = st.selectbox(
             "Filter by source:",
-            ["All"] + list(set([doc['source'] for doc in sample_docs]))
+            ["All"] + sorted(docs_df['source'].cat.categories)
         )
     with col2:
         topic_filter = st.selectbox(
             "Filter by topic:",
-            ["All"] + list(set([topic for doc in sample_docs for topic in doc['topics']]))
+            ["All"] + sorted(topics_df['topics'].unique())
         )
     with col3:
         date_filter = st.date_input("Filter by date (after):", value=None)
     
     # Document display
-    filtered_docs = sample_docs
+    mask = np.ones(len(docs_df), dtype=bool)
     if source_filter != "All":
-        filtered_docs = [doc for doc in filtered_docs if doc['source'] == source_filter]
+        mask &= (docs_df['source'] == source_filter).values
     if topic_filter != "All":
-        filtered_docs = [doc for doc in filtered_docs if topic_filter in doc['topics']]
+        mask &= docs_df.index.isin(topics_df.loc[topics_df['topics'] == topic_filter, 'index'])
+    filtered_docs = docs_df.loc[mask]
     
     st.write(f"**Showing {len(filtered_docs)} documents**")
     
-    for i, doc in enumerate(filtered_docs):
-        with st.expander(f"📄 {doc['title']}"):
+    for doc in filtered_docs.itertuples():
+        with st.expander(f"📄 {doc.title}"):
             col1, col2 = st.columns([2, 1])
             with col1:
-                st.write(doc['content'])
+                st.write(doc.content)
             with col2:
-                st.write(f"**Source:** {doc['source']}")
-                st.write(f"**Date:** {doc['date']}")
-                st.write(f"**Topics:** {', '.join(doc['topics'])}")
-                if st.button(f"🔍 Query about this", key=f"query_doc_{i}"):
+                st.write(f"**Source:** {doc.source}")
+                st.write(f"**Date:** {doc.date}")
+                st.write(f"**Topics:** {', '.join(doc.topics)}")
+                if st.button(f"🔍 Query about this", key=f"query_doc_{doc.Index}"):
                     st.switch_page("🤖 RAG Query System")
     
     # Document upload interface
@@ -428,9 +634,18 @@ def show_knowledge_base():
     if uploaded_file:
         st.success(f"File '{uploaded_file.name}' uploaded successfully!")
         if st.button("Process Document"):
-            with st.spinner("Processing document..."):
-                time.sleep(2)
-                st.success("Document processed and added to knowledge base!")
+            with st.status("Processing document...") as status:
+                run_async(asyncio.sleep(2))
+                status.update(label="Document processed and added to knowledge base!", state="complete")
+
+async def _crawl_source(source):
+    """Crawl a single source (simulated)"""
+    await asyncio.sleep(1)
+    return source
+
+async def _crawl_sources(sources):
+    """Crawl all selected sources concurrently"""
+    return await asyncio.gather(*(_crawl_source(source) for source in sources))
 
 def show_crawling_interface():
     """Show web crawling interface"""
@@ -440,27 +655,18 @@ def show_crawling_interface():
     # Data sources configuration
     st.subheader("📂 Data Sources")
     
-    sources = [
-        {"name": "ArXiv Papers", "url": "arxiv.org", "status": "active", "last_crawl": "2024-07-27 14:30"},
-        {"name": "IEEE Xplore", "url": "ieeexplore.ieee.org", "status": "active", "last_crawl": "2024-07-27 09:15"},
-        {"name": "Semiconductor News", "url": "various news sites", "status": "active", "last_crawl": "2024-07-28 08:00"},
-        {"name": "Patent Database", "url": "patents.google.com", "status": "inactive", "last_crawl": "2024-07-26 16:45"},
-        {"name": "Industry Reports", "url": "various industry sites", "status": "active", "last_crawl": "2024-07-27 20:30"}
-    ]
-    
-    for source in sources:
-        col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
-        with col1:
-            st.write(f"**{source['name']}**")
-        with col2:
-            st.write(source['url'])
-        with col3:
-            if source['status'] == 'active':
-                st.success("Active")
-            else:
-                st.error("Inactive")
-        with col4:
-            st.write(source['last_crawl'])
+    sources = _sources()
+    st.dataframe(
+        _sources_df(),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "name": st.column_config.TextColumn("Source"),
+            "url": st.column_config.TextColumn("URL"),
+            "status": st.column_config.TextColumn("Status"),
+            "last_crawl": st.column_config.TextColumn("Last Crawl")
+        }
+    )
     
     st.divider()
     
@@ -476,13 +682,11 @@ def show_crawling_interface():
         
         if st.button("Start Crawling", type="primary"):
             if selected_sources:
-                with st.spinner("Starting crawling process..."):
-                    progress_bar = st.progress(0)
-                    for i, source in enumerate(selected_sources):
-                        st.write(f"Crawling {source}...")
-                        time.sleep(1)
-                        progress_bar.progress((i + 1) / len(selected_sources))
-                    st.success("Crawling completed successfully!")
+                with st.status("Starting crawling process...", expanded=True) as status:
+                    st.write(f"Crawling {', '.join(selected_sources)}...")
+                    # Sources are crawled concurrently, so this takes as long as the slowest one
+                    run_async(_crawl_sources(selected_sources))
+                    status.update(label="Crawling completed successfully!", state="complete")
             else:
                 st.warning("Please select at least one source to crawl.")
     
@@ -508,6 +712,7 @@ def show_crawling_interface():
 
 def show_system_monitor():
     """Show system monitoring interface"""
+    import pandas as pd
     st.header("🔧 System Monitor")
     st.markdown("Real-time monitoring of system health and performance.")
     
@@ -528,22 +733,20 @@ def show_system_monitor():
         
         # Component status
         components = ['database', 'filesystem', 'configuration', 'api_connectivity']
-        cols = st.columns(len(components))
+        component_rows = []
         
-        for i, component in enumerate(components):
-            with cols[i]:
-                if component in system_status:
-                    status_info = system_status[component]
-                    if isinstance(status_info, dict) and 'status' in status_info:
-                        status = status_info['status']
-                        st.markdown(f"**{component.title()}**")
-                        st.markdown(format_status_display(status), unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"**{component.title()}**")
-                        st.info("Status unknown")
+        for component in components:
+            if component in system_status:
+                status_info = system_status[component]
+                if isinstance(status_info, dict) and 'status' in status_info:
+                    status = status_info['status'].title()
                 else:
-                    st.markdown(f"**{component.title()}**")
-                    st.info("Not monitored")
+                    status = "Unknown"
+            else:
+                status = "Not monitored"
+            component_rows.append({'Component': component.title(), 'Status': status})
+        
+        st.dataframe(pd.DataFrame(component_rows), use_container_width=True, hide_index=True)
     
     except Exception as e:
         st.error(f"Error fetching system status: {e}")
@@ -574,25 +777,18 @@ def show_system_monitor():
     with col2:
         # Response times (simulated)
         st.write("**Response Times**")
+        i = np.arange(24)
         times = pd.DataFrame({
             'Time': pd.date_range('2024-07-28 00:00', periods=24, freq='H'),
-            'Response Time (ms)': [800 + i*10 + (i%3)*50 for i in range(24)]
+            'Response Time (ms)': 800 + i*10 + (i%3)*50
         })
         
-        fig = px.line(times, x='Time', y='Response Time (ms)', title='24-Hour Response Time Trend')
+        fig = _build_response_time_fig(tuple(times['Time']), tuple(times['Response Time (ms)']))
         st.plotly_chart(fig, use_container_width=True)
     
     # System logs
     st.subheader("📋 Recent System Logs")
-    sample_logs = [
-        {"timestamp": "2024-07-28 12:45:23", "level": "INFO", "message": "RAG query processed successfully"},
-        {"timestamp": "2024-07-28 12:44:15", "level": "INFO", "message": "Document added to knowledge base"},
-        {"timestamp": "2024-07-28 12:43:02", "level": "WARNING", "message": "API rate limit approaching"},
-        {"timestamp": "2024-07-28 12:42:18", "level": "INFO", "message": "Scheduled crawling started"},
-        {"timestamp": "2024-07-28 12:41:30", "level": "INFO", "message": "Health check completed"},
-    ]
-    
-    log_df = pd.DataFrame(sample_logs)
+    log_df = _recent_logs_df()
     st.dataframe(log_df, use_container_width=True)
 
 def show_analytics():
@@ -607,22 +803,16 @@ def show_analytics():
         st.subheader("📊 Query Analytics")
         
         # Top topics
-        topics_data = {
-            'Topic': ['EUV Lithography', '3nm Process', 'AI in Manufacturing', 'Yield Optimization', 'Memory Technologies'],
-            'Queries': [45, 38, 32, 28, 22]
-        }
-        fig = px.bar(topics_data, x='Queries', y='Topic', orientation='h', title='Most Queried Topics')
+        topics_data = _topics_data()
+        fig = _build_topics_bar(topics_data['Topic'], topics_data['Queries'])
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("🌍 Geographic Distribution")
         
         # Geographic data (simulated)
-        geo_data = {
-            'Country': ['United States', 'Taiwan', 'South Korea', 'Japan', 'Germany', 'China'],
-            'Users': [156, 89, 67, 45, 34, 123]
-        }
-        fig = px.pie(geo_data, values='Users', names='Country', title='User Distribution by Country')
+        geo_data = _geo_data()
+        fig = _build_geo_pie(geo_data['Country'], geo_data['Users'])
         st.plotly_chart(fig, use_container_width=True)
     
     # Knowledge base analytics
@@ -645,27 +835,18 @@ def show_analytics():
     # Trend analysis
     st.subheader("📈 Trend Analysis")
     
-    # Create sample trend data
-    dates = pd.date_range(start='2024-01-01', end='2024-07-28', freq='W')
-    trends_data = pd.DataFrame({
-        'Date': dates,
-        'Documents Added': [20 + i*2 + (i%4)*5 for i in range(len(dates))],
-        'Queries Processed': [150 + i*10 + (i%3)*20 for i in range(len(dates))],
-        'User Engagement': [0.7 + (i%10)*0.02 for i in range(len(dates))]
-    })
-    
     tab1, tab2, tab3 = st.tabs(["📄 Document Growth", "🔍 Query Volume", "👥 User Engagement"])
     
     with tab1:
-        fig = px.line(trends_data, x='Date', y='Documents Added', title='Weekly Document Addition Trend')
+        fig = _build_trend_line('Documents Added', 'Weekly Document Addition Trend')
         st.plotly_chart(fig, use_container_width=True)
     
     with tab2:
-        fig = px.line(trends_data, x='Date', y='Queries Processed', title='Weekly Query Volume Trend')
+        fig = _build_trend_line('Queries Processed', 'Weekly Query Volume Trend')
         st.plotly_chart(fig, use_container_width=True)
     
     with tab3:
-        fig = px.line(trends_data, x='Date', y='User Engagement', title='User Engagement Score Trend')
+        fig = _build_trend_line('User Engagement', 'User Engagement Score Trend')
         st.plotly_chart(fig, use_container_width=True)
 
 if __name__ == "__main__":
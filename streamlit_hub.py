@@ -6,11 +6,14 @@ Modular architecture for hosting multiple Streamlit apps in one deployment
 """
 
 import streamlit as st
+import functools
 import importlib.util
+import os
+import py_compile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import sys
-from typing import Dict, Any
-import traceback
+
+import apps
 
 # Configure the main hub
 st.set_page_config(
@@ -20,78 +23,205 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+APPS_DIR = Path(apps.__path__[0])
+HOME_APP = "🏠 Hub Home"
+
+# Statuses are resolved to small integer codes at registration; unknown statuses get the last code
+STATUS_CODES = {"active": 0, "development": 1, "planning": 2, "experimental": 3}
+STATUS_EMOJI = ("🟢", "🟡", "🔵", "🟠", "⚪")
+
+STATUS_MESSAGES = {
+    "development": "🚧 This app is currently under development",
+    "planning": "📋 This app is in the planning phase",
+    "experimental": "🔬 This app is experimental"
+}
+
+WELCOME_MD = """
+### 🎯 Your Digital Workshop
+
+This is your centralized hub for all Streamlit projects. Each app runs 
+independently but shares the same deployment, saving you hosting costs 
+and simplifying management.
+
+**🌟 Benefits:**
+- ✅ One deployment, multiple apps
+- ✅ Shared resources and styling  
+- ✅ Easy navigation between projects
+- ✅ Unified user experience
+"""
+
+@st.cache_data(show_spinner=False)
+def _build_category_index(apps_signature: tuple) -> dict:
+    """Map each category to the registry indices of its apps, given (name, category) pairs"""
+    by_category = {}
+    for i, (app_name, category) in enumerate(apps_signature):
+        if app_name != HOME_APP:
+            by_category.setdefault(category, []).append(i)
+    return {category: tuple(indices) for category, indices in by_category.items()}
+
+@st.cache_resource
+def _get_preload_executor():
+    """Thread pool shared by all sessions for background app preloading"""
+    return ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="hub-preload")
+
+def _compile_if_stale(path: Path):
+    """Write the app's __pycache__ bytecode unless it is already newer than the source"""
+    try:
+        cached = Path(importlib.util.cache_from_source(str(path)))
+        if cached.exists() and cached.stat().st_mtime >= path.stat().st_mtime:
+            return
+        py_compile.compile(str(path), doraise=False)
+    except OSError:
+        pass  # Read-only deploy or vanished file; the import compiles in memory instead
+
+@functools.lru_cache(maxsize=64)
+def _resolve_entrypoint(module_name: str):
+    """Return an app's main() (or run()) function, or None if it has neither"""
+    # The apps package imports sub-apps lazily on first attribute access
+    module = getattr(apps, module_name)
+    return getattr(module, 'main', None) or getattr(module, 'run', None)
+
+# Only needed on error / "Random App" paths, so imported on first use
+@functools.lru_cache(maxsize=None)
+def _traceback():
+    import traceback
+    return traceback
+
+@functools.lru_cache(maxsize=None)
+def _random():
+    import random
+    return random
+
+class AppConfig:
+    """Registry entry for an app hosted by the hub (module is None for the home page)"""
+    # Hand-written __slots__ rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("module", "description", "status", "category")
+    
+    def __init__(self, module, description: str, status: str, category: str):
+        self.module = module
+        self.description = description
+        self.status = status
+        self.category = category
+    
+    def __repr__(self) -> str:
+        return (
+            f"AppConfig(module={self.module!r}, description={self.description!r}, "
+            f"status={self.status!r}, category={self.category!r})"
+        )
+
 class AppManager:
     """Manages multiple Streamlit applications"""
     
     def __init__(self):
         self.apps = {}
+        self._available_paths = {}
         self.register_apps()
+        self._discover_app_files()
     
     def register_apps(self):
         """Register all available apps"""
         self.apps = {
-            "🏠 Hub Home": {
-                "module": None,
-                "description": "Welcome to your project universe",
-                "status": "active",
-                "category": "core"
-            },
-            "🔬 Semiconductor Learning": {
-                "module": "semiconductor_app",
-                "description": "AI-powered semiconductor knowledge system",
-                "status": "active", 
-                "category": "ai"
-            },
-            "📊 Data Analytics": {
-                "module": "analytics_app",
-                "description": "Advanced data analysis and visualization",
-                "status": "development",
-                "category": "analytics"
-            },
-            "🤖 AI Assistant": {
-                "module": "ai_assistant_app", 
-                "description": "Multi-purpose AI chat assistant",
-                "status": "active",
-                "category": "ai"
-            },
-            "💰 Portfolio Tracker": {
-                "module": "portfolio_app",
-                "description": "Investment portfolio management",
-                "status": "planning",
-                "category": "finance"
-            },
-            "🎮 Game Engine": {
-                "module": "game_app",
-                "description": "Interactive game development tools",
-                "status": "experimental",
-                "category": "entertainment"
-            }
+            HOME_APP: AppConfig(
+                module=None,
+                description="Welcome to your project universe",
+                status="active",
+                category="core"
+            ),
+            "🔬 Semiconductor Learning": AppConfig(
+                module="semiconductor_app",
+                description="AI-powered semiconductor knowledge system",
+                status="active",
+                category="ai"
+            ),
+            "📊 Data Analytics": AppConfig(
+                module="analytics_app",
+                description="Advanced data analysis and visualization",
+                status="development",
+                category="analytics"
+            ),
+            "🤖 AI Assistant": AppConfig(
+                module="ai_assistant_app",
+                description="Multi-purpose AI chat assistant",
+                status="active",
+                category="ai"
+            ),
+            "💰 Portfolio Tracker": AppConfig(
+                module="portfolio_app",
+                description="Investment portfolio management",
+                status="planning",
+                category="finance"
+            ),
+            "🎮 Game Engine": AppConfig(
+                module="game_app",
+                description="Interactive game development tools",
+                status="experimental",
+                category="entertainment"
+            )
         }
+        self._index_apps()
+    
+    def _index_apps(self):
+        """Precompute per-field tuples and category buckets so rendering doesn't rescan self.apps"""
+        configs = tuple(self.apps.values())
+        self.app_names = tuple(self.apps)
+        self.app_index = {app_name: i for i, app_name in enumerate(self.app_names)}
+        self._modules = tuple(config.module for config in configs)
+        self._statuses = tuple(config.status for config in configs)
+        self._status_codes = tuple(STATUS_CODES.get(status, len(STATUS_CODES)) for status in self._statuses)
+        self._categories = tuple(config.category for config in configs)
+        self._descriptions = tuple(config.description for config in configs)
+        self._launch_keys = tuple(f"launch_{app_name}" for app_name in self.app_names)
+        
+        # Category -> indices into the tuples above, in registration order (home excluded);
+        # cached across sessions since every session registers the same apps
+        self._by_category = _build_category_index(tuple(zip(self.app_names, self._categories)))
+        
+        self._active_app_names = tuple(
+            app_name for app_name, status in zip(self.app_names, self._statuses)
+            if status == "active" and app_name != HOME_APP
+        )
+        
+        # Hub stats; like the category buckets these exclude the home page
+        self._total_apps = len(self.app_names) - 1
+        self._active_count = len(self._active_app_names)
+    
+    def _discover_app_files(self):
+        """Scan apps/ once for app modules, instead of stat-ing a file per rerun"""
+        try:
+            with os.scandir(APPS_DIR) as entries:
+                self._available_paths = {
+                    entry.name[:-3]: Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".py") and entry.is_file(follow_symlinks=False)
+                }
+        except FileNotFoundError:
+            self._available_paths = {}
+        
+        # Fire-and-forget: warm bytecode for every app while the first page renders
+        executor = _get_preload_executor()
+        for module_path in self._available_paths.values():
+            executor.submit(_compile_if_stale, module_path)
     
     def load_app(self, app_name: str):
         """Dynamically load and execute an app"""
-        app_config = self.apps.get(app_name)
+        try:
+            app_config = self.apps[app_name]
+        except KeyError:
+            self.show_home()
+            return
         
-        if not app_config or not app_config["module"]:
+        module_name = app_config.module
+        if module_name is None:
             self.show_home()
             return
-            
+        
         try:
             # Try to import the app module
-            module_name = app_config["module"]
-            
-            # Check if module file exists
-            module_path = Path(f"apps/{module_name}.py")
-            if module_path.exists():
-                spec = importlib.util.spec_from_file_location(module_name, module_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
+            if module_name in self._available_paths:
                 # Execute the main function if it exists
-                if hasattr(module, 'main'):
-                    module.main()
-                elif hasattr(module, 'run'):
-                    module.run()
+                entrypoint = _resolve_entrypoint(module_name)
+                if entrypoint is not None:
+                    entrypoint()
                 else:
                     st.error(f"App {app_name} doesn't have a main() or run() function")
             else:
@@ -100,7 +230,7 @@ class AppManager:
         except Exception as e:
             st.error(f"Error loading app {app_name}: {str(e)}")
             with st.expander("🐛 Debug Info"):
-                st.code(traceback.format_exc())
+                st.code(_traceback().format_exc())
     
     def show_home(self):
         """Show the hub home page"""
@@ -109,89 +239,52 @@ class AppManager:
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            st.markdown("""
-            ### 🎯 Your Digital Workshop
-            
-            This is your centralized hub for all Streamlit projects. Each app runs 
-            independently but shares the same deployment, saving you hosting costs 
-            and simplifying management.
-            
-            **🌟 Benefits:**
-            - ✅ One deployment, multiple apps
-            - ✅ Shared resources and styling  
-            - ✅ Easy navigation between projects
-            - ✅ Unified user experience
-            """)
+            st.markdown(WELCOME_MD)
             
             # App categories
-            categories = {}
-            for app_name, config in self.apps.items():
-                if app_name == "🏠 Hub Home":
-                    continue
-                cat = config["category"]
-                if cat not in categories:
-                    categories[cat] = []
-                categories[cat].append((app_name, config))
-            
-            for category, apps in categories.items():
+            for category, indices in self._by_category.items():
                 st.subheader(f"📁 {category.title()} Apps")
                 
-                for app_name, config in apps:
+                for i in indices:
+                    app_name = self.app_names[i]
+                    status = self._statuses[i]
                     col_a, col_b, col_c = st.columns([3, 1, 1])
                     
                     with col_a:
                         st.write(f"**{app_name}**")
-                        st.caption(config["description"])
+                        st.caption(self._descriptions[i])
                     
                     with col_b:
-                        status_color = {
-                            "active": "🟢",
-                            "development": "🟡", 
-                            "planning": "🔵",
-                            "experimental": "🟠"
-                        }
-                        st.write(f"{status_color.get(config['status'], '⚪')} {config['status']}")
+                        st.write(f"{STATUS_EMOJI[self._status_codes[i]]} {status}")
                     
                     with col_c:
-                        if st.button("Launch", key=f"launch_{app_name}"):
+                        if st.button("Launch", key=self._launch_keys[i]):
                             st.session_state.selected_app = app_name
                             st.rerun()
         
         with col2:
             # Quick stats
             st.subheader("📊 Hub Stats")
-            total_apps = len(self.apps) - 1  # Exclude home
-            active_apps = len([a for a in self.apps.values() if a["status"] == "active"])
-            
-            st.metric("Total Apps", total_apps)
-            st.metric("Active Apps", active_apps)
-            st.metric("Categories", len(categories))
+            st.metric("Total Apps", self._total_apps)
+            st.metric("Active Apps", self._active_count)
+            st.metric("Categories", len(self._by_category))
             
             # Quick actions
             st.subheader("⚡ Quick Actions")
             if st.button("🎯 Random App", help="Try a random active app"):
-                active_app_names = [name for name, config in self.apps.items() 
-                                  if config["status"] == "active" and name != "🏠 Hub Home"]
-                if active_app_names:
-                    import random
-                    random_app = random.choice(active_app_names)
+                if self._active_app_names:
+                    random_app = _random().choice(self._active_app_names)
                     st.session_state.selected_app = random_app
                     st.rerun()
     
-    def show_app_placeholder(self, app_name: str, config: Dict[str, Any]):
+    def show_app_placeholder(self, app_name: str, config: AppConfig):
         """Show placeholder for apps under development"""
         st.title(f"{app_name}")
         
-        status_messages = {
-            "development": "🚧 This app is currently under development",
-            "planning": "📋 This app is in the planning phase", 
-            "experimental": "🔬 This app is experimental"
-        }
-        
-        st.info(status_messages.get(config["status"], "This app is not ready yet"))
-        st.write(f"**Description:** {config['description']}")
+        st.info(STATUS_MESSAGES.get(config.status, "This app is not ready yet"))
+        st.write(f"**Description:** {config.description}")
         
-        if config["status"] == "development":
+        if config.status == "development":
             st.markdown("""
             ### 🛠️ Development Status
             - [ ] Core functionality
@@ -201,41 +294,44 @@ class AppManager:
             """)
         
         if st.button("🏠 Back to Hub"):
-            st.session_state.selected_app = "🏠 Hub Home"
+            st.session_state.selected_app = HOME_APP
             st.rerun()
 
+@st.cache_resource
+def get_app_manager() -> AppManager:
+    """Get the app manager shared by all sessions"""
+    return AppManager()
+
 def main():
     """Main hub application"""
     
-    # Initialize app manager
-    if 'app_manager' not in st.session_state:
-        st.session_state.app_manager = AppManager()
-    
-    app_manager = st.session_state.app_manager
+    # The app registry is the same for every session; only the selection is per-session
+    app_manager = get_app_manager()
     
     # Sidebar navigation
     st.sidebar.title("🚀 Project Universe")
     st.sidebar.markdown("---")
     
     # App selector
+    current_app = st.session_state.get('selected_app', HOME_APP)
     selected_app = st.sidebar.selectbox(
         "🎯 Select Application:",
-        list(app_manager.apps.keys()),
-        index=0 if 'selected_app' not in st.session_state else 
-              list(app_manager.apps.keys()).index(st.session_state.get('selected_app', "🏠 Hub Home"))
+        app_manager.app_names,
+        index=app_manager.app_index.get(current_app, 0)
     )
     
     # Update session state
     st.session_state.selected_app = selected_app
     
     # App info in sidebar
-    if selected_app in app_manager.apps:
-        config = app_manager.apps[selected_app]
-        st.sidebar.markdown(f"**Status:** {config['status']}")
-        st.sidebar.markdown(f"**Category:** {config['category']}")
+    config = app_manager.apps.get(selected_app)
+    if config is not None:
+        status, category, description = config.status, config.category, config.description
+        # One element for both lines (two spaces + newline is a markdown line break)
+        st.sidebar.markdown(f"**Status:** {status}  \n**Category:** {category}")
         
-        if config.get('description'):
-            st.sidebar.caption(config['description'])
+        if description:
+            st.sidebar.caption(description)
     
     st.sidebar.markdown("---")
     
@@ -243,11 +339,14 @@ def main():
     st.sidebar.subheader("🛠️ Hub Controls")
     
     if st.sidebar.button("🏠 Hub Home"):
-        st.session_state.selected_app = "🏠 Hub Home"
+        st.session_state.selected_app = HOME_APP
         st.rerun()
         
     if st.sidebar.button("🔄 Refresh Apps"):
-        app_manager.register_apps()
+        # Swap in a freshly built manager rather than mutating the shared one
+        # while other sessions are rendering from it
+        get_app_manager.clear()
+        _resolve_entrypoint.cache_clear()
         st.rerun()
     
     # Theme toggle